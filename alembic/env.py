@@ -1,7 +1,9 @@
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from logging.config import fileConfig
 
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -15,11 +17,29 @@ from app.users.models import User  # noqa: F401
 
 config = context.config
 
-if config.config_file_name is not None:
+# Skip logging setup when migrations are run from the application
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 target_metadata = Base.metadata
 
+# Arbitrary application-wide key for pg_advisory_lock around upgrades
+MIGRATION_LOCK_KEY = 0x4D494752
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """
+    Exclude dialect-specific schema objects when autogenerating for another dialect.
+
+    Objects restricted to one dialect carry its name in info["dialect"], such as
+    the PostgreSQL trigram indexes.
+
+    Returns:
+        False if the object belongs to a different dialect, True otherwise
+    """
+    dialect = getattr(object, "info", {}).get("dialect")
+    return dialect is None or dialect == context.get_context().dialect.name
+
 
 def get_url():
     """
@@ -47,6 +67,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -55,6 +76,32 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+@contextmanager
+def migration_lock(connection: Connection) -> Iterator[None]:
+    """
+    Hold a PostgreSQL advisory lock for the duration of the migrations.
+
+    Serializes concurrent upgrades, such as several app workers started with
+    MIGRATION_MODE=sync or async; the later ones find the database at head. The
+    lock is session-level, so it survives the commits of autocommit blocks.
+    Other dialects are not locked.
+
+    Args:
+        connection: Database connection
+    """
+    if connection.dialect.name != "postgresql":
+        yield
+        return
+
+    connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        connection.commit()
+
+
 def do_run_migrations(connection: Connection) -> None:
     """
     Run migrations with database connection.
@@ -62,9 +109,11 @@ def do_run_migrations(connection: Connection) -> None:
     Args:
         connection: Database connection
     """
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object
+    )
 
-    with context.begin_transaction():
+    with migration_lock(connection), context.begin_transaction():
         context.run_migrations()
 
 
@@ -17,6 +17,78 @@ down_revision: str | None = None
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+# (index name, table name, columns, unique)
+INDEXES: list[tuple[str, str, list[str], bool]] = [
+    ("ix_roles_id", "roles", ["id"], False),
+    ("ix_roles_name", "roles", ["name"], True),
+    ("ix_permissions_id", "permissions", ["id"], False),
+    ("ix_permissions_name", "permissions", ["name"], True),
+    ("ix_roles_permissions_permission_id", "roles_permissions", ["permission_id"], False),
+    ("ix_roles_permissions_role_id", "roles_permissions", ["role_id"], False),
+    ("ix_users_id", "users", ["id"], False),
+    ("ix_users_email", "users", ["email"], True),
+    ("ix_users_username", "users", ["username"], True),
+    ("ix_users_role_id", "users", ["role_id"], False),
+]
+
+
+def _is_postgresql() -> bool:
+    """
+    Check whether the migration targets PostgreSQL.
+
+    Works in both online and offline (--sql) mode.
+
+    Returns:
+        True if the migration dialect is PostgreSQL
+    """
+    return op.get_context().dialect.name == "postgresql"
+
+
+def create_indexes() -> None:
+    """
+    Create all indexes defined in INDEXES.
+
+    On PostgreSQL, indexes are built with CREATE INDEX CONCURRENTLY inside an
+    autocommit block so that writes to the tables are not blocked while the
+    index is built. Other dialects use a regular CREATE INDEX.
+    """
+    if not _is_postgresql():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(op.f(name), table, columns, unique=unique)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(
+                op.f(name),
+                table,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def drop_indexes() -> None:
+    """
+    Drop all indexes defined in INDEXES, in reverse order.
+
+    Uses DROP INDEX CONCURRENTLY on PostgreSQL.
+    """
+    if not _is_postgresql():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(op.f(name), table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                op.f(name),
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
 
 def upgrade() -> None:
     op.create_table(
@@ -28,8 +100,6 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_roles_id"), "roles", ["id"], unique=False)
-    op.create_index(op.f("ix_roles_name"), "roles", ["name"], unique=True)
 
     op.create_table(
         "permissions",
@@ -40,8 +110,6 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_permissions_id"), "permissions", ["id"], unique=False)
-    op.create_index(op.f("ix_permissions_name"), "permissions", ["name"], unique=True)
 
     op.create_table(
         "roles_permissions",
@@ -57,15 +125,6 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("role_id", "permission_id"),
     )
-    op.create_index(
-        op.f("ix_roles_permissions_permission_id"),
-        "roles_permissions",
-        ["permission_id"],
-        unique=False,
-    )
-    op.create_index(
-        op.f("ix_roles_permissions_role_id"), "roles_permissions", ["role_id"], unique=False
-    )
 
     op.create_table(
         "users",
@@ -82,24 +141,13 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
-    op.create_index(op.f("ix_users_username"), "users", ["username"], unique=True)
-    op.create_index(op.f("ix_users_role_id"), "users", ["role_id"], unique=False)
+
+    create_indexes()
 
 
 def downgrade() -> None:
-    op.drop_index(op.f("ix_users_role_id"), table_name="users")
-    op.drop_index(op.f("ix_users_username"), table_name="users")
-    op.drop_index(op.f("ix_users_email"), table_name="users")
-    op.drop_index(op.f("ix_users_id"), table_name="users")
+    drop_indexes()
     op.drop_table("users")
-    op.drop_index(op.f("ix_roles_permissions_role_id"), table_name="roles_permissions")
-    op.drop_index(op.f("ix_roles_permissions_permission_id"), table_name="roles_permissions")
     op.drop_table("roles_permissions")
-    op.drop_index(op.f("ix_permissions_name"), table_name="permissions")
-    op.drop_index(op.f("ix_permissions_id"), table_name="permissions")
     op.drop_table("permissions")
-    op.drop_index(op.f("ix_roles_name"), table_name="roles")
-    op.drop_index(op.f("ix_roles_id"), table_name="roles")
     op.drop_table("roles")
@@ -18,6 +18,23 @@ down_revision: str | None = "001"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+SEED_BATCH_SIZE = 10_000
+
+
+def _insert_rows(table: sa.TableClause, rows: list[dict]) -> None:
+    """
+    Insert seed rows using multi-row INSERT statements.
+
+    Emits one ``INSERT ... VALUES (...), (...)`` per batch instead of one
+    statement per row, keeping each statement below SEED_BATCH_SIZE rows.
+
+    Args:
+        table: Lightweight table clause to insert into
+        rows: Row dictionaries to insert
+    """
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        op.execute(sa.insert(table).values(rows[start : start + SEED_BATCH_SIZE]))
+
 
 def upgrade() -> None:
     roles_table = sa.table(
@@ -46,7 +63,7 @@ def upgrade() -> None:
 
     now = datetime.utcnow()
 
-    op.bulk_insert(
+    _insert_rows(
         roles_table,
         [
             {
@@ -73,7 +90,7 @@ def upgrade() -> None:
         ],
     )
 
-    op.bulk_insert(
+    _insert_rows(
         permissions_table,
         [
             {
@@ -114,7 +131,7 @@ def upgrade() -> None:
         ],
     )
 
-    op.bulk_insert(
+    _insert_rows(
         roles_permissions_table,
         [
             {"role_id": 1, "permission_id": 1},
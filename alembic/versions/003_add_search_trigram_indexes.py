@@ -0,0 +1,61 @@
+"""Add trigram indexes for role and permission search
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-01 00:02:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table name, column)
+# GIN trigram indexes let PostgreSQL serve the ILIKE '%search%' filters in
+# get_roles/get_permissions with an index scan instead of a sequential scan.
+TRIGRAM_INDEXES: list[tuple[str, str, str]] = [
+    ("ix_roles_name_trgm", "roles", "name"),
+    ("ix_roles_description_trgm", "roles", "description"),
+    ("ix_permissions_name_trgm", "permissions", "name"),
+    ("ix_permissions_description_trgm", "permissions", "description"),
+]
+
+
+def upgrade() -> None:
+    # pg_trgm is PostgreSQL-only; other dialects keep using sequential scans
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # The pg_trgm extension is left installed, other objects may depend on it
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,48 @@
+"""Add users (created_at, id) index for sorted listing
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-01 00:03:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Serves ORDER BY created_at, id and the matching keyset filter in get_users
+INDEX_NAME = "ix_users_created_at_id"
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        op.create_index(INDEX_NAME, "users", ["created_at", "id"])
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "users",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        op.drop_index(INDEX_NAME, table_name="users")
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,57 @@
+"""Add trigram indexes for user search
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-01-01 00:04:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table name, column)
+# Serve the ILIKE '%search%' filters on email and username in get_users.
+TRIGRAM_INDEXES: list[tuple[str, str, str]] = [
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_users_username_trgm", "users", "username"),
+]
+
+
+def upgrade() -> None:
+    # pg_trgm is PostgreSQL-only; other dialects keep using sequential scans
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,59 @@
+"""Add server defaults for created_at and updated_at
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-01-01 00:05:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMESTAMP_TABLES: list[str] = ["roles", "permissions", "users"]
+TIMESTAMP_COLUMNS: list[str] = ["created_at", "updated_at"]
+
+# The columns are naive DateTime holding UTC. PostgreSQL's now() is in the session
+# time zone, so it is converted to UTC; SQLite's CURRENT_TIMESTAMP is already UTC.
+UTC_NOW_BY_DIALECT = {
+    "postgresql": "timezone('utc', now())",
+}
+DEFAULT_UTC_NOW = "CURRENT_TIMESTAMP"
+
+
+def _set_server_default(default: sa.TextClause | None) -> None:
+    """
+    Set or drop the server default of every timestamp column.
+
+    SQLite cannot alter column defaults in place, so it uses batch mode, which
+    recreates the table.
+
+    Args:
+        default: Server default expression, or None to drop it
+    """
+    if op.get_context().dialect.name != "sqlite":
+        for table in TIMESTAMP_TABLES:
+            for column in TIMESTAMP_COLUMNS:
+                op.alter_column(table, column, server_default=default)
+        return
+
+    for table in TIMESTAMP_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            for column in TIMESTAMP_COLUMNS:
+                batch_op.alter_column(column, server_default=default)
+
+
+def upgrade() -> None:
+    dialect = op.get_context().dialect.name
+    _set_server_default(sa.text(UTC_NOW_BY_DIALECT.get(dialect, DEFAULT_UTC_NOW)))
+
+
+def downgrade() -> None:
+    _set_server_default(None)
@@ -0,0 +1,48 @@
+"""Drop redundant roles_permissions.role_id index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-01-01 00:06:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# role_id lookups are served by the (role_id, permission_id) primary key
+INDEX_NAME = "ix_roles_permissions_role_id"
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        op.drop_index(INDEX_NAME, table_name="roles_permissions")
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="roles_permissions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "postgresql":
+        op.create_index(INDEX_NAME, "roles_permissions", ["role_id"])
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "roles_permissions",
+            ["role_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
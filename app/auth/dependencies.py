@@ -1,38 +1,69 @@
+from dataclasses import dataclass
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.security import decode_access_token
 from app.db.session import get_db
-from app.rbac.models import Role
 from app.users.models import User
+from app.users.service import get_user_by_id
 
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
     """
-    Dependency to get current authenticated user.
+    Immutable authorization snapshot of the current user.
+
+    Attributes:
+        id: User ID
+        role_name: Name of the user's role, or None if no role is assigned
+        permission_names: Names of the permissions granted by the role
+    """
+
+    id: int
+    role_name: str | None
+    permission_names: frozenset[str]
+
+
+# user_id -> AuthenticatedUser. Invalidation is per process, so other workers may
+# authorize against a stale snapshot for up to the TTL.
+current_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def invalidate_current_user_cache(user_id: int | None = None) -> None:
+    """
+    Drop cached authorization snapshots.
+
+    Must be called after a user, their password, their role or role permissions
+    are modified.
+
+    Args:
+        user_id: ID of the user to drop, or None to clear the whole cache
+    """
+    if user_id is None:
+        current_user_cache.clear()
+    else:
+        current_user_cache.pop(user_id, None)
 
-    Loads user with role and permissions using eager loading to prevent N+1 problems.
+
+def _get_token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """
+    Extract the user ID from a bearer token.
 
     Args:
         credentials: HTTP Bearer token credentials
-        db: Database session
 
     Returns:
-        Current authenticated user with role and permissions loaded
+        ID of the user the token was issued to
 
     Raises:
-        HTTPException: 401 if token is invalid or user not found
+        HTTPException: 401 if token is invalid
     """
-    token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = decode_access_token(credentials.credentials)
 
     if payload is None:
         raise HTTPException(
@@ -50,7 +81,7 @@ async def get_current_user(
         )
 
     try:
-        user_id = int(user_id_raw)
+        return int(user_id_raw)
     except (ValueError, TypeError) as err:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,13 +89,22 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from err
 
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
-        .filter(User.id == user_id)
-    )
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
+
+async def _load_user(db: AsyncSession, user_id: int) -> User:
+    """
+    Load a user with role and permissions.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        User with role and permissions loaded
+
+    Raises:
+        HTTPException: 401 if user not found
+    """
+    user = await get_user_by_id(db, user_id)
 
     if user is None:
         raise HTTPException(
@@ -74,3 +114,66 @@ async def get_current_user(
         )
 
     return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Dependency to get current authenticated user.
+
+    Loads user with role and permissions using eager loading to prevent N+1 problems.
+    The user is always loaded in the request's session; use get_authenticated_user
+    when only authorization data is needed.
+
+    Args:
+        credentials: HTTP Bearer token credentials
+        db: Database session
+
+    Returns:
+        Current authenticated user with role and permissions loaded
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    return await _load_user(db, _get_token_user_id(credentials))
+
+
+async def get_authenticated_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> AuthenticatedUser:
+    """
+    Dependency to get an authorization snapshot of the current user.
+
+    Snapshots are cached by user ID for a short time, so repeated requests with
+    the same token skip the database.
+
+    Args:
+        credentials: HTTP Bearer token credentials
+        db: Database session
+
+    Returns:
+        Snapshot of the current user's ID, role name and permission names
+
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    user_id = _get_token_user_id(credentials)
+
+    authenticated_user = current_user_cache.get(user_id)
+    if authenticated_user is not None:
+        return authenticated_user
+
+    user = await _load_user(db, user_id)
+    role = user.role
+    authenticated_user = AuthenticatedUser(
+        id=user.id,
+        role_name=role.name if role else None,
+        permission_names=(
+            frozenset(perm.name for perm in role.permissions) if role else frozenset()
+        ),
+    )
+    current_user_cache[user_id] = authenticated_user
+    return authenticated_user
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import get_current_user, invalidate_current_user_cache
 from app.auth.schemas import (
     ChangePasswordRequest,
     ForgotPasswordRequest,
@@ -24,7 +24,6 @@ from app.core.security import create_access_token, validate_password_strength
 from app.db.session import get_db
 from app.users.models import User
 from app.users.schemas import UserResponse
-from app.users.service import get_user_by_email, get_user_by_username
 
 router = APIRouter()
 rate_limit_config = get_rate_limit_config()
@@ -50,28 +49,20 @@ async def register(
     Raises:
         HTTPException: 400 if email/username already exists or password is weak
     """
-    is_valid, error_msg = validate_password_strength(user_data.password)
+    is_valid, error_msg = validate_password_strength(user_data.password.get_secret_value())
     if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error_msg,
         )
 
-    existing_user = await get_user_by_email(db, user_data.email)
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
-    existing_user = await get_user_by_username(db, user_data.username)
-    if existing_user:
+    try:
+        user = await create_user(db, user_data)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken",
-        )
-
-    user = await create_user(db, user_data)
+            detail=str(e),
+        ) from e
     access_token = create_access_token(data={"sub": user.id})
 
     return Token(access_token=access_token)
@@ -131,6 +122,7 @@ async def get_current_user_info(
 @limiter.limit(rate_limit_config["auth_endpoints"])
 async def forgot_password(
     request: Request,
+    background_tasks: BackgroundTasks,
     forgot_password_data: ForgotPasswordRequest,
     db: AsyncSession = Depends(get_db),
 ):
@@ -139,10 +131,12 @@ async def forgot_password(
 
     Sends a password reset email to the user if the email exists.
     For security reasons, always returns success message even if email doesn't exist
-    to prevent email enumeration attacks.
+    to prevent email enumeration attacks. The email is sent in the background so
+    response time is the same for registered and unknown emails.
 
     Args:
         request: FastAPI request object
+        background_tasks: FastAPI background tasks
         forgot_password_data: Email address for password reset
         db: Database session
 
@@ -157,7 +151,7 @@ async def forgot_password(
         ```
     """
     try:
-        await request_password_reset(db, forgot_password_data.email)
+        await request_password_reset(db, forgot_password_data.email, background_tasks)
     except Exception:
         pass
 
@@ -202,7 +196,9 @@ async def reset_password_endpoint(
         ```
     """
     try:
-        await reset_password(db, reset_data.token, reset_data.new_password)
+        user = await reset_password(
+            db, reset_data.token, reset_data.new_password.get_secret_value()
+        )
     except ValueError as e:
         error_msg = str(e)
         if "Invalid or expired" in error_msg:
@@ -221,6 +217,7 @@ async def reset_password_endpoint(
                 detail=error_msg,
             ) from e
 
+    invalidate_current_user_cache(user.id)
     return PasswordResetResponse(message="Password has been reset successfully")
 
 
@@ -262,8 +259,8 @@ async def change_password_endpoint(
         await change_password(
             db,
             current_user.id,
-            change_password_data.old_password,
-            change_password_data.new_password,
+            change_password_data.old_password.get_secret_value(),
+            change_password_data.new_password.get_secret_value(),
         )
     except ValueError as e:
         error_msg = str(e)
@@ -283,4 +280,5 @@ async def change_password_endpoint(
                 detail=error_msg,
             ) from e
 
+    invalidate_current_user_cache(current_user.id)
     return PasswordResetResponse(message="Password has been changed successfully")
@@ -1,4 +1,17 @@
-from pydantic import BaseModel
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, EmailStr, SecretStr, StringConstraints
+
+# Request bodies are read-only and reject unknown fields before any DB work.
+# Whitespace is not stripped globally so passwords are kept exactly as typed.
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+Username = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True, min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$"
+    ),
+]
 
 
 class Token(BaseModel):
@@ -23,8 +36,10 @@ class UserLogin(BaseModel):
         password: User password
     """
 
+    model_config = REQUEST_MODEL_CONFIG
+
     username: str
-    password: str
+    password: SecretStr
 
 
 class UserRegister(BaseModel):
@@ -33,13 +48,15 @@ class UserRegister(BaseModel):
 
     Attributes:
         email: User email address
-        username: Username
+        username: Username (letters, digits and underscores, 3-50 characters)
         password: User password
     """
 
-    email: str
-    username: str
-    password: str
+    model_config = REQUEST_MODEL_CONFIG
+
+    email: EmailStr
+    username: Username
+    password: SecretStr
 
 
 class ForgotPasswordRequest(BaseModel):
@@ -50,7 +67,9 @@ class ForgotPasswordRequest(BaseModel):
         email: User email address to send password reset link
     """
 
-    email: str
+    model_config = REQUEST_MODEL_CONFIG
+
+    email: EmailStr
 
 
 class ResetPasswordRequest(BaseModel):
@@ -62,8 +81,10 @@ class ResetPasswordRequest(BaseModel):
         new_password: New password to set
     """
 
+    model_config = REQUEST_MODEL_CONFIG
+
     token: str
-    new_password: str
+    new_password: SecretStr
 
 
 class ChangePasswordRequest(BaseModel):
@@ -75,8 +96,10 @@ class ChangePasswordRequest(BaseModel):
         new_password: New password to set
     """
 
-    old_password: str
-    new_password: str
+    model_config = REQUEST_MODEL_CONFIG
+
+    old_password: SecretStr
+    new_password: SecretStr
 
 
 class PasswordResetResponse(BaseModel):
@@ -1,25 +1,49 @@
-from sqlalchemy import select
+from fastapi import BackgroundTasks
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.core.security import (
     create_password_reset_token,
     get_password_hash,
+    password_needs_rehash,
+    run_password_kdf,
+    validate_password_strength,
     verify_password,
     verify_password_reset_token,
 )
 from app.mail.service import send_email_with_template
-from app.rbac.models import Role
 from app.users.models import User
 from app.users.schemas import UserCreate
-from app.users.service import get_user_by_email, get_user_by_id, get_user_by_username
+from app.users.service import (
+    email_exists,
+    get_user_by_email,
+    get_user_by_id,
+    get_user_by_username_or_email,
+    get_users_by_email_or_username,
+)
+
+# Verified against when no user matches, so failed logins take the same KDF time
+# whether or not the username exists
+DUMMY_PASSWORD_HASH = get_password_hash("dummy-password-not-used-for-auth")
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+INSERT_BY_DIALECT = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 
 
 async def authenticate_user(db: AsyncSession, username: str, password: str) -> User | None:
     """
     Authenticate user by username/email and password.
 
+    Legacy bcrypt hashes (and Argon2id hashes with outdated parameters) are
+    upgraded to the current Argon2id parameters on successful login. Unknown
+    users are verified against a dummy hash so response time does not reveal
+    whether the user exists.
+
     Args:
         db: Database session
         username: Username or email
@@ -28,16 +52,18 @@ async def authenticate_user(db: AsyncSession, username: str, password: str) -> U
     Returns:
         User object if authentication succeeds, None otherwise
     """
-    user = await get_user_by_username(db, username)
-    if not user:
-        user = await get_user_by_email(db, username)
-
+    user = await get_user_by_username_or_email(db, username)
     if not user:
+        await run_password_kdf(verify_password, password, DUMMY_PASSWORD_HASH)
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await run_password_kdf(verify_password, password, user.hashed_password):
         return None
 
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await run_password_kdf(get_password_hash, password)
+        await db.commit()
+
     return user
 
 
@@ -45,6 +71,10 @@ async def create_user(db: AsyncSession, user_data: UserCreate, role_id: int = 2)
     """
     Create a new user.
 
+    The user is inserted with ON CONFLICT DO NOTHING, so uniqueness of email and
+    username is enforced atomically by the database in a single statement. The
+    conflicting field is only looked up when the insert did not create a row.
+
     Args:
         db: Database session
         user_data: User creation data
@@ -52,28 +82,43 @@ async def create_user(db: AsyncSession, user_data: UserCreate, role_id: int = 2)
 
     Returns:
         Created user object
+
+    Raises:
+        ValueError: If email is already registered
+        ValueError: If username is already taken
     """
-    hashed_password = get_password_hash(user_data.password)
-    db_user = User(
-        email=user_data.email,
-        username=user_data.username,
-        hashed_password=hashed_password,
-        role_id=role_id,
+    hashed_password = await run_password_kdf(
+        get_password_hash, user_data.password.get_secret_value()
     )
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
-
+    insert = INSERT_BY_DIALECT[db.get_bind().dialect.name]
     stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
-        .filter(User.id == db_user.id)
+        insert(User)
+        .values(
+            email=user_data.email,
+            username=user_data.username,
+            hashed_password=hashed_password,
+            role_id=role_id,
+        )
+        .on_conflict_do_nothing()
+        .returning(User.id)
     )
-    result = await db.execute(stmt)
-    return result.scalar_one()
+    user_id = (await db.execute(stmt)).scalar_one_or_none()
+    if user_id is None:
+        await db.rollback()
+        existing_users = await get_users_by_email_or_username(
+            db, user_data.email, user_data.username
+        )
+        if any(user.email == user_data.email for user in existing_users):
+            raise ValueError("Email already registered")
+        raise ValueError("Username already taken")
+    await db.commit()
+
+    return await get_user_by_id(db, user_id)
 
 
-async def request_password_reset(db: AsyncSession, email: str) -> bool:
+async def request_password_reset(
+    db: AsyncSession, email: str, background_tasks: BackgroundTasks | None = None
+) -> bool:
     """
     Request password reset by sending reset email to user.
 
@@ -81,18 +126,22 @@ async def request_password_reset(db: AsyncSession, email: str) -> bool:
     For security, it always returns True even if the email doesn't exist
     to prevent email enumeration attacks.
 
+    Unknown emails only cost an index lookup. When background_tasks is given,
+    the email is sent after the response so that response time does not reveal
+    whether the email is registered.
+
     Args:
         db: Database session
         email: User email address
+        background_tasks: Optional background tasks to send the email with
 
     Returns:
         True (always returns True for security reasons)
 
     Raises:
-        Exception: If email sending fails
+        Exception: If email sending fails (only when sent inline)
     """
-    user = await get_user_by_email(db, email)
-    if not user:
+    if not await email_exists(db, email):
         return True
 
     reset_token = create_password_reset_token(email)
@@ -103,12 +152,16 @@ async def request_password_reset(db: AsyncSession, email: str) -> bool:
         "expiry_minutes": settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES,
     }
 
-    await send_email_with_template(
-        recipients=[email],
-        subject="Password Reset Request",
-        template_name="password_reset.html",
-        template_body=template_body,
-    )
+    email_kwargs = {
+        "recipients": [email],
+        "subject": "Password Reset Request",
+        "template_name": "password_reset.html",
+        "template_body": template_body,
+    }
+    if background_tasks is not None:
+        background_tasks.add_task(send_email_with_template, **email_kwargs)
+    else:
+        await send_email_with_template(**email_kwargs)
 
     return True
 
@@ -129,8 +182,6 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> Use
         ValueError: If token is invalid or expired
         ValueError: If password doesn't meet strength requirements
     """
-    from app.core.security import validate_password_strength
-
     email = verify_password_reset_token(token)
     if not email:
         raise ValueError("Invalid or expired reset token")
@@ -143,17 +194,10 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> Use
     if not is_valid:
         raise ValueError(error_msg)
 
-    user.hashed_password = get_password_hash(new_password)
+    # The session does not expire objects on commit, so the user keeps the role
+    # and permissions it was loaded with and needs no refresh or reload.
+    user.hashed_password = await run_password_kdf(get_password_hash, new_password)
     await db.commit()
-    await db.refresh(user)
-
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
-        .filter(User.id == user.id)
-    )
-    result = await db.execute(stmt)
-    updated_user = result.scalar_one()
 
     template_body = {}
     await send_email_with_template(
@@ -163,7 +207,7 @@ async def reset_password(db: AsyncSession, token: str, new_password: str) -> Use
         template_body=template_body,
     )
 
-    return updated_user
+    return user
 
 
 async def change_password(
@@ -186,30 +230,19 @@ async def change_password(
         ValueError: If password doesn't meet strength requirements
         ValueError: If user not found
     """
-    from app.core.security import validate_password_strength
-
     user = await get_user_by_id(db, user_id)
     if not user:
         raise ValueError("User not found")
 
-    if not verify_password(old_password, user.hashed_password):
+    if not await run_password_kdf(verify_password, old_password, user.hashed_password):
         raise ValueError("Incorrect old password")
 
     is_valid, error_msg = validate_password_strength(new_password)
     if not is_valid:
         raise ValueError(error_msg)
 
-    user.hashed_password = get_password_hash(new_password)
+    user.hashed_password = await run_password_kdf(get_password_hash, new_password)
     await db.commit()
-    await db.refresh(user)
-
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
-        .filter(User.id == user_id)
-    )
-    result = await db.execute(stmt)
-    updated_user = result.scalar_one()
 
     template_body = {"username": user.username}
     await send_email_with_template(
@@ -219,4 +252,4 @@ async def change_password(
         template_body=template_body,
     )
 
-    return updated_user
+    return user
@@ -1,6 +1,11 @@
+from functools import cached_property
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+MigrationMode = Literal["skip", "sync", "async"]
+
 
 class Settings(BaseSettings):
     PROJECT_NAME: str
@@ -13,20 +18,27 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 1800
     DB_ECHO: bool = False
+    MIGRATION_MODE: MigrationMode = "skip"
 
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int
+    # Concurrent password hashes; defaults to the CPUs available to the process
+    PASSWORD_HASH_WORKERS: int | None = Field(default=None, ge=1)
     FRONTEND_URL: str
 
+    CORS_ENABLED: bool = True
     CORS_ORIGINS: str
 
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_AUTHENTICATED: int = 100
     RATE_LIMIT_UNAUTHENTICATED: int = 20
     RATE_LIMIT_AUTH_ENDPOINTS: int = 5
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
 
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "text"
@@ -48,10 +60,11 @@ class Settings(BaseSettings):
     MAIL_USE_CREDENTIALS: bool = Field(default=True)
     MAIL_VALIDATE_CERTS: bool = Field(default=True)
     MAIL_TEMPLATE_FOLDER: str | None = Field(default=None)
+    MAIL_BULK_CONNECTIONS: int = Field(default=5, ge=1)
 
-    @property
-    def cors_origins_list(self) -> list[str]:
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
 
     class Config:
         env_file = ".env"
@@ -1,7 +1,19 @@
 from fastapi import Depends, HTTPException, status
 
-from app.auth.dependencies import get_current_user
-from app.users.models import User
+from app.auth.dependencies import (
+    AuthenticatedUser,
+    get_authenticated_user,
+    invalidate_current_user_cache,
+)
+
+
+def invalidate_role_permissions_cache() -> None:
+    """
+    Clear the cached permissions of every authenticated user.
+
+    Must be called after roles or role permissions are modified.
+    """
+    invalidate_current_user_cache()
 
 
 class PermissionChecker:
@@ -13,6 +25,8 @@ class PermissionChecker:
         Depends(PermissionChecker(["read_user", "update_user"]))
     """
 
+    __slots__ = ("required_permissions",)
+
     def __init__(self, required_permissions: str | list[str]):
         """
         Initialize permission checker.
@@ -21,19 +35,18 @@ class PermissionChecker:
             required_permissions: Single permission name or list of permission names
         """
         if isinstance(required_permissions, str):
-            self.required_permissions = [required_permissions]
-        else:
-            self.required_permissions = required_permissions
+            required_permissions = [required_permissions]
+        self.required_permissions = frozenset(required_permissions)
 
     async def __call__(
         self,
-        current_user: User = Depends(get_current_user),
-    ) -> User:
+        current_user: AuthenticatedUser = Depends(get_authenticated_user),
+    ) -> AuthenticatedUser:
         """
         Check if current user has required permissions.
 
         Args:
-            current_user: Current authenticated user (from get_current_user dependency)
+            current_user: Current authenticated user (from get_authenticated_user dependency)
 
         Returns:
             Current user if permissions check passes
@@ -41,20 +54,19 @@ class PermissionChecker:
         Raises:
             HTTPException: 403 if user doesn't have required permissions
         """
-        if not current_user.role:
+        if current_user.role_name is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User has no role assigned",
             )
 
-        user_permissions = {perm.name for perm in current_user.role.permissions}
-
-        for required_perm in self.required_permissions:
-            if required_perm not in user_permissions:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Permission '{required_perm}' required",
-                )
+        missing_permissions = self.required_permissions - current_user.permission_names
+        if missing_permissions:
+            missing = ", ".join(f"'{perm}'" for perm in sorted(missing_permissions))
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Permission {missing} required",
+            )
 
         return current_user
 
@@ -67,6 +79,8 @@ class RoleChecker:
         Depends(RoleChecker(["admin", "moderator"]))
     """
 
+    __slots__ = ("allowed_roles",)
+
     def __init__(self, allowed_roles: list[str]):
         """
         Initialize role checker.
@@ -74,17 +88,17 @@ class RoleChecker:
         Args:
             allowed_roles: List of allowed role names
         """
-        self.allowed_roles = allowed_roles
+        self.allowed_roles = frozenset(allowed_roles)
 
     async def __call__(
         self,
-        current_user: User = Depends(get_current_user),
-    ) -> User:
+        current_user: AuthenticatedUser = Depends(get_authenticated_user),
+    ) -> AuthenticatedUser:
         """
         Check if current user has one of the allowed roles.
 
         Args:
-            current_user: Current authenticated user (from get_current_user dependency)
+            current_user: Current authenticated user (from get_authenticated_user dependency)
 
         Returns:
             Current user if role check passes
@@ -92,16 +106,16 @@ class RoleChecker:
         Raises:
             HTTPException: 403 if user doesn't have allowed role
         """
-        if not current_user.role:
+        if current_user.role_name is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User has no role assigned",
             )
 
-        if current_user.role.name not in self.allowed_roles:
+        if current_user.role_name not in self.allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{current_user.role.name}' not allowed. Required: {self.allowed_roles}",
+                detail=f"Role '{current_user.role_name}' not allowed. Required: {sorted(self.allowed_roles)}",
             )
 
         return current_user
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, field_validator
+from enum import Enum
+
+from pydantic import BaseModel, Field
 
 
 class PaginationParams(BaseModel):
@@ -13,29 +15,23 @@ class PaginationParams(BaseModel):
     skip: int = Field(default=0, ge=0, description="Number of records to skip")
     limit: int = Field(default=10, ge=1, le=100, description="Maximum number of records to return")
 
-    @field_validator("skip")
-    @classmethod
-    def validate_skip(cls, v: int) -> int:
-        if v < 0:
-            raise ValueError("skip must be non-negative")
-        return v
-
-    @field_validator("limit")
-    @classmethod
-    def validate_limit(cls, v: int) -> int:
-        if v < 1 or v > 100:
-            raise ValueError("limit must be between 1 and 100")
-        return v
-
 
-class SortOrder(str):
+class SortOrder(str, Enum):
     """
     Sort order enumeration.
+
+    Values are matched case-insensitively.
     """
 
     ASC = "asc"
     DESC = "desc"
 
+    @classmethod
+    def _missing_(cls, value: object) -> "SortOrder | None":
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
 
 class SortParams(BaseModel):
     """
@@ -47,15 +43,7 @@ class SortParams(BaseModel):
     """
 
     sort_by: str = Field(default="id", description="Field name to sort by")
-    order: str = Field(default="asc", description="Sort order: asc or desc")
-
-    @field_validator("order")
-    @classmethod
-    def validate_order(cls, v: str) -> str:
-        v_lower = v.lower()
-        if v_lower not in ["asc", "desc"]:
-            raise ValueError("order must be 'asc' or 'desc'")
-        return v_lower
+    order: SortOrder = Field(default=SortOrder.ASC, description="Sort order: asc or desc")
 
 
 class SearchParams(BaseModel):
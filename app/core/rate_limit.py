@@ -1,16 +1,21 @@
+from functools import lru_cache
+
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from app.core.config import settings
 
-limiter = Limiter(key_func=get_remote_address, storage_uri="memory://")
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI)
 
 
+@lru_cache(maxsize=1)
 def get_rate_limit_config() -> dict:
     """
     Get rate limit configuration from settings.
 
+    Built once and shared by all routers.
+
     Returns:
         Dictionary with rate limit configurations
     """
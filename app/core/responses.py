@@ -0,0 +1,26 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson serializes dicts, lists and datetimes natively in C, so plain
+    data returned from the database can be rendered without a Pydantic
+    round-trip.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize response content to JSON bytes.
+
+        Args:
+            content: Response content
+
+        Returns:
+            JSON encoded content
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
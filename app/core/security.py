@@ -1,16 +1,137 @@
+import asyncio
+import hashlib
+import os
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from app.core.config import settings
 
+HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def hmac_uses_openssl() -> bool:
+    """
+    Check whether JWT HMAC digests are backed by OpenSSL.
+
+    OpenSSL dispatches SHA-2 to hardware instructions (SHA-NI, ARMv8 crypto
+    extensions) where available; CPython's builtin fallback is much slower.
+
+    Returns:
+        True if every HMAC digest used for JWT signing comes from OpenSSL
+    """
+    return all(digest.__module__ == "_hashlib" for digest in HMAC_DIGESTS.values())
+
+
+# Encoded once: the signing key never changes at runtime
+_SECRET_KEY_BYTES = settings.SECRET_KEY.encode("utf-8")
+
+
+def encode_token(claims: dict) -> str:
+    """
+    Encode and sign a JWT.
+
+    Args:
+        claims: Claims to encode; datetime "exp", "iat" and "nbf" values are
+            converted to timestamps by PyJWT
+
+    Returns:
+        The encoded JWT token string
+    """
+    return jwt.encode(claims, _SECRET_KEY_BYTES, algorithm=settings.ALGORITHM)
+
+
+def decode_token(token: str) -> dict | None:
+    """
+    Verify and decode a JWT.
+
+    Verification is left to PyJWT: the token must be signed with the configured
+    algorithm, must not be expired or not yet valid, and "sub" must be a string
+    if present.
+
+    Args:
+        token: The encoded JWT token string
+
+    Returns:
+        The token claims if the token is valid, None otherwise
+    """
+    try:
+        return jwt.decode(token, _SECRET_KEY_BYTES, algorithms=[settings.ALGORITHM])
+    except jwt.InvalidTokenError:
+        return None
+
+
+# Argon2id hasher for new password hashes. argon2-cffi dispatches to the
+# SIMD-optimized libargon2 kernels where the CPU supports them.
+password_hasher = PasswordHasher(
+    time_cost=3,
+    memory_cost=65536,
+    parallelism=1,
+    hash_len=32,
+    type=Type.ID,
+)
+
+CGROUP_CPU_MAX_PATH = Path("/sys/fs/cgroup/cpu.max")
+
+
+def available_cpu_count() -> int:
+    """
+    Count the CPUs this process is allowed to use.
+
+    Starts from the CPU affinity mask and caps it by the cgroup v2 CPU quota, so a
+    container limited to two CPUs on a large host reports 2 rather than the host's
+    core count.
+
+    Returns:
+        Number of usable CPUs, at least 1
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    try:
+        quota, period = CGROUP_CPU_MAX_PATH.read_text().split()
+        if quota != "max":
+            count = min(count, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+
+    return count
+
+
+# Dedicated pool for the password KDF. libargon2 and bcrypt release the GIL, so one
+# thread per usable CPU lets concurrent hashes use every core, while the pool size
+# caps how many 64 MiB Argon2 buffers are allocated at once. The pool lives for the
+# whole process and is never shut down, so the app can be started more than once.
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS or available_cpu_count(),
+    thread_name_prefix="password-hash",
+)
+
+# Prefix of hashes produced by password_hasher; anything else is a legacy bcrypt hash
+ARGON2_HASH_PREFIX = "$argon2"
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
 
+    Argon2id hashes are verified with argon2-cffi. Hashes created before the
+    switch to Argon2id are still verified with bcrypt.
+
     Args:
         plain_password: The plain text password to verify
         hashed_password: The hashed password to compare against
@@ -18,12 +139,18 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    if not hashed_password.startswith(ARGON2_HASH_PREFIX):
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
 
     Args:
         password: The plain text password to hash
@@ -31,12 +158,51 @@ def get_password_hash(password: str) -> str:
     Returns:
         The hashed password
     """
-    password_bytes = password.encode("utf-8")
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode("utf-8")
+    return password_hasher.hash(password)
+
+
+async def run_password_kdf(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a password hashing or verification function off the event loop.
+
+    Args:
+        func: verify_password or get_password_hash
+        *args: Arguments passed to func
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_hash_executor, func, *args)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a password hash should be replaced with a fresh one.
+
+    True for legacy bcrypt hashes and for Argon2id hashes created with
+    different parameters than password_hasher.
+
+    Args:
+        hashed_password: The stored password hash
+
+    Returns:
+        True if the password should be rehashed, False otherwise
+    """
+    if not hashed_password.startswith(ARGON2_HASH_PREFIX):
+        return True
+    return password_hasher.check_needs_rehash(hashed_password)
+
+
+PASSWORD_STRENGTH_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"[A-Z]"), "Password must contain at least one uppercase letter"),
+    (re.compile(r"[a-z]"), "Password must contain at least one lowercase letter"),
+    (re.compile(r"\d"), "Password must contain at least one digit"),
+    (
+        re.compile(r"[!@#$%^&*(),.?\":{}|<>]"),
+        "Password must contain at least one special character",
+    ),
+)
 
 
 def validate_password_strength(password: str) -> tuple[bool, str | None]:
@@ -59,17 +225,9 @@ def validate_password_strength(password: str) -> tuple[bool, str | None]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    if not re.search(r"[A-Z]", password):
-        return False, "Password must contain at least one uppercase letter"
-
-    if not re.search(r"[a-z]", password):
-        return False, "Password must contain at least one lowercase letter"
-
-    if not re.search(r"\d", password):
-        return False, "Password must contain at least one digit"
-
-    if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
-        return False, "Password must contain at least one special character"
+    for pattern, error_message in PASSWORD_STRENGTH_RULES:
+        if pattern.search(password) is None:
+            return False, error_message
 
     return True, None
 
@@ -93,8 +251,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     to_encode.update({"exp": expire})
     if "sub" in to_encode:
         to_encode["sub"] = str(to_encode["sub"])
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return encode_token(to_encode)
 
 
 def decode_access_token(token: str) -> dict | None:
@@ -107,11 +264,7 @@ def decode_access_token(token: str) -> dict | None:
     Returns:
         The decoded token payload if valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
-        return None
+    return decode_token(token)
 
 
 def create_password_reset_token(email: str) -> str:
@@ -126,8 +279,7 @@ def create_password_reset_token(email: str) -> str:
     """
     expire = datetime.utcnow() + timedelta(minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES)
     to_encode = {"sub": email, "type": "password_reset", "exp": expire}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return encode_token(to_encode)
 
 
 def verify_password_reset_token(token: str) -> str | None:
@@ -140,11 +292,8 @@ def verify_password_reset_token(token: str) -> str | None:
     Returns:
         Email address if token is valid, None otherwise
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        if payload.get("type") != "password_reset":
-            return None
-        email: str = payload.get("sub")
-        return email
-    except JWTError:
+    payload = decode_token(token)
+    if payload is None or payload.get("type") != "password_reset":
         return None
+    email: str = payload.get("sub")
+    return email
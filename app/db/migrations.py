@@ -0,0 +1,99 @@
+import asyncio
+import contextlib
+import logging
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from app.core.config import MigrationMode
+
+ALEMBIC_INI_PATH = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+MIGRATION_STATUS: dict[str, str | None] = {
+    "mode": None,
+    "status": "not_started",
+}
+
+
+def get_alembic_config() -> Config:
+    """
+    Build Alembic configuration for running migrations from the application.
+
+    Returns:
+        Alembic Config pointing at the project's alembic.ini
+    """
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    # Keep the application's logging configuration intact
+    config.attributes["configure_logger"] = False
+    return config
+
+
+async def run_migrations() -> None:
+    """
+    Upgrade the database to the latest Alembic revision.
+
+    Alembic runs its own event loop, so the upgrade is executed in a worker
+    thread to keep the application event loop free. Progress is recorded in
+    MIGRATION_STATUS for the health endpoint.
+
+    Raises:
+        Exception: Any error raised by the upgrade, after it has been recorded
+    """
+    MIGRATION_STATUS["status"] = "running"
+    try:
+        await asyncio.to_thread(command.upgrade, get_alembic_config(), "head")
+    except Exception as e:
+        # Only the status is exposed on /health; errors may contain SQL or host names
+        MIGRATION_STATUS["status"] = "failed"
+        logging.error(f"Database migrations failed: {e}", exc_info=True)
+        raise
+
+    MIGRATION_STATUS["status"] = "completed"
+    logging.info("Database migrations completed")
+
+
+async def start_migrations(mode: MigrationMode) -> asyncio.Task | None:
+    """
+    Run migrations according to the configured migration mode.
+
+    Args:
+        mode: "sync" to block startup until migrations finish, "async" to run
+            them in a background task, or "skip" to leave them to the operator
+
+    Returns:
+        Background task when mode is "async", None otherwise
+
+    Raises:
+        Exception: If migrations fail in "sync" mode, so startup is aborted
+    """
+    MIGRATION_STATUS["mode"] = mode
+
+    if mode == "sync":
+        await run_migrations()
+        return None
+
+    if mode == "async":
+        return asyncio.create_task(run_migrations())
+
+    MIGRATION_STATUS["status"] = "skipped"
+    return None
+
+
+async def stop_migrations(task: asyncio.Task | None) -> None:
+    """
+    Cancel a background migration task and wait for it to finish.
+
+    The Alembic upgrade itself runs in a worker thread and cannot be interrupted;
+    cancellation only stops waiting for it. Failures were already recorded and
+    logged by run_migrations.
+
+    Args:
+        task: Task returned by start_migrations, or None
+    """
+    if task is None:
+        return
+
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
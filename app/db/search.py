@@ -0,0 +1,49 @@
+from sqlalchemy import Index
+
+LIKE_ESCAPE_CHAR = "\\"
+
+
+def contains_pattern(search: str) -> str:
+    """
+    Build a LIKE/ILIKE pattern matching values that contain the search text.
+
+    LIKE wildcards in the search text are escaped, so "%" and "_" match
+    literally and user input cannot produce patterns such as "%%%%" that
+    defeat trigram indexes. Use with ``escape=LIKE_ESCAPE_CHAR``.
+
+    Args:
+        search: Raw search text
+
+    Returns:
+        Escaped pattern wrapped in "%" wildcards
+    """
+    escaped = (
+        search.replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+        .replace("%", LIKE_ESCAPE_CHAR + "%")
+        .replace("_", LIKE_ESCAPE_CHAR + "_")
+    )
+    return f"%{escaped}%"
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """
+    Declare a GIN trigram index serving ILIKE '%search%' filters on a column.
+
+    Declared on the models so Alembic autogenerate keeps the indexes created by
+    the migrations. They are PostgreSQL-only (pg_trgm): create_all skips them on
+    other dialects, and alembic/env.py excludes them from autogenerate there.
+
+    Args:
+        name: Index name
+        column: Name of the indexed column
+
+    Returns:
+        Index to place in a model's __table_args__
+    """
+    return Index(
+        name,
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+        info={"dialect": "postgresql"},
+    ).ddl_if(dialect="postgresql")
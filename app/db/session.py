@@ -1,13 +1,41 @@
+from typing import Any
+
+from sqlalchemy import Executable
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
+IS_ASYNCPG = make_url(settings.DATABASE_URL).get_driver_name() == "asyncpg"
+
+# asyncpg only: larger prepared statement caches (asyncpg's own and SQLAlchemy's
+# adapter cache) so repeated queries skip server-side parsing and planning, and
+# JIT disabled since compiling is slower than running these short OLTP queries.
+ASYNCPG_CONNECT_ARGS = {
+    "statement_cache_size": 1024,
+    "prepared_statement_cache_size": 1024,
+    "server_settings": {"jit": "off", "application_name": settings.PROJECT_NAME},
+}
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
     echo=settings.DB_ECHO,
+    connect_args=ASYNCPG_CONNECT_ARGS if IS_ASYNCPG else {},
+)
+
+# Dedicated single-connection engine for health checks, so they don't compete with
+# application traffic for pooled connections and fail fast instead of queueing.
+health_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=1,
+    connect_args={"server_settings": {"statement_timeout": "500"}} if IS_ASYNCPG else {},
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -35,3 +63,20 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def scalar_in_new_session(stmt: Executable) -> Any:
+    """
+    Execute a read-only statement on its own short-lived session.
+
+    Lets an independent query (such as a list count) run concurrently with
+    queries on the request session, which cannot run two statements at once.
+
+    Args:
+        stmt: Statement to execute
+
+    Returns:
+        The first column of the first result row
+    """
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(stmt)
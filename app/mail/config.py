@@ -1,14 +1,21 @@
+import logging
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi_mail import ConnectionConfig
+from jinja2 import Template
 
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
 def get_mail_config() -> ConnectionConfig:
     """
     Get FastMail connection configuration from settings.
 
+    Built on first use and cached, so importing the mail package does no
+    filesystem checks.
+
     Returns:
         ConnectionConfig instance with mail settings
     """
@@ -49,4 +56,41 @@ def get_mail_config() -> ConnectionConfig:
     return config
 
 
-mail_config = get_mail_config()
+@lru_cache(maxsize=1)
+def get_mail_templates() -> dict[str, Template]:
+    """
+    Get all mail templates, loaded and compiled once per process.
+
+    fastapi-mail builds a new Jinja2 environment for every send, so each
+    templated email would otherwise re-read and re-parse its template.
+
+    Returns:
+        Mapping of template file name to compiled template, empty when no
+        template folder is configured
+    """
+    config = get_mail_config()
+    if not config.TEMPLATE_FOLDER:
+        return {}
+
+    env = config.template_engine()
+    return {name: env.get_template(name) for name in env.list_templates()}
+
+
+def warm_up_mail_templates() -> None:
+    """
+    Load mail templates at startup so the first templated send does not pay for it.
+
+    Skipped when mail is not configured. Failures are logged rather than raised,
+    so a broken template folder cannot abort startup; templated sends will report
+    the error instead.
+    """
+    if not settings.MAIL_FROM or not settings.MAIL_SERVER:
+        return
+
+    try:
+        templates = get_mail_templates()
+    except Exception as e:
+        logging.warning(f"Mail templates could not be loaded during startup: {e}")
+        return
+
+    logging.info(f"Loaded {len(templates)} mail templates")
@@ -12,6 +12,7 @@ from fastapi.responses import JSONResponse
 from fastapi_mail import MessageSchema, MessageType
 from starlette.requests import Request
 
+from app.auth.dependencies import AuthenticatedUser
 from app.core.dependencies import PermissionChecker
 from app.core.rate_limit import get_rate_limit_config, limiter
 from app.mail.schemas import (
@@ -27,18 +28,22 @@ from app.mail.service import (
     send_email_with_template,
     send_multipart_email,
 )
-from app.users.models import User
 
 router = APIRouter()
 rate_limit_config = get_rate_limit_config()
 
+# Bodies used when the request does not provide one
+DEFAULT_HTML_BODY = "<p>Hi, thanks for using Fastapi-mail</p>"
+DEFAULT_TEXT_BODY = "Simple background task"
+DEFAULT_BULK_HTML_BODY = "<p>Bulk email</p>"
+
 
 @router.post("/email", status_code=status.HTTP_200_OK)
 @limiter.limit(rate_limit_config["authenticated"])
 async def send_email_endpoint(
     request: Request,
     email_data: EmailSchema,
-    current_user: User = Depends(PermissionChecker("send_email")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("send_email")),
 ) -> JSONResponse:
     """
     Send a standard email.
@@ -51,11 +56,7 @@ async def send_email_endpoint(
         JSON response with success message
     """
     try:
-        html_body = (
-            email_data.body.get("html", "<p>Hi, thanks for using Fastapi-mail</p>")
-            if email_data.body
-            else "<p>Hi, thanks for using Fastapi-mail</p>"
-        )
+        html_body = (email_data.body or {}).get("html", DEFAULT_HTML_BODY)
         await send_email(
             recipients=email_data.email,
             subject="Fastapi-Mail module",
@@ -76,7 +77,7 @@ async def send_email_background_endpoint(
     request: Request,
     background_tasks: BackgroundTasks,
     email_data: EmailSchema,
-    current_user: User = Depends(PermissionChecker("send_email")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("send_email")),
 ) -> JSONResponse:
     """
     Send email as a background task.
@@ -90,11 +91,7 @@ async def send_email_background_endpoint(
         JSON response with success message
     """
     try:
-        body = (
-            email_data.body.get("text", "Simple background task")
-            if email_data.body
-            else "Simple background task"
-        )
+        body = (email_data.body or {}).get("text", DEFAULT_TEXT_BODY)
         await send_email_background(
             background_tasks=background_tasks,
             recipients=email_data.email,
@@ -115,7 +112,7 @@ async def send_email_background_endpoint(
 async def send_email_template_endpoint(
     request: Request,
     email_data: EmailWithTemplateSchema,
-    current_user: User = Depends(PermissionChecker("send_email")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("send_email")),
 ) -> JSONResponse:
     """
     Send email using Jinja2 template.
@@ -149,7 +146,7 @@ async def send_email_attachment_endpoint(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     email: str = Form(...),
-    current_user: User = Depends(PermissionChecker("send_email")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("send_email")),
 ) -> JSONResponse:
     """
     Send email with file attachment.
@@ -185,7 +182,7 @@ async def send_email_attachment_endpoint(
 async def send_email_multipart_endpoint(
     request: Request,
     email_data: EmailMultipartSchema,
-    current_user: User = Depends(PermissionChecker("send_email")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("send_email")),
 ) -> JSONResponse:
     """
     Send multipart email (HTML + plain text).
@@ -217,7 +214,7 @@ async def send_email_multipart_endpoint(
 async def send_email_bulk_endpoint(
     request: Request,
     email_data: BulkEmailSchema,
-    current_user: User = Depends(PermissionChecker("send_email")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("send_email")),
 ) -> JSONResponse:
     """
     Send multiple emails using a single SMTP connection.
@@ -232,11 +229,7 @@ async def send_email_bulk_endpoint(
     try:
         messages = []
         for email_item in email_data.emails:
-            body = (
-                email_item.body.get("html", "<p>Bulk email</p>")
-                if email_item.body
-                else "<p>Bulk email</p>"
-            )
+            body = (email_item.body or {}).get("html", DEFAULT_BULK_HTML_BODY)
             message = MessageSchema(
                 subject="Fastapi-Mail module",
                 recipients=email_item.email,
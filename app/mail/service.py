@@ -1,10 +1,22 @@
+import asyncio
+from functools import lru_cache
+
 from fastapi import BackgroundTasks
 from fastapi_mail import FastMail, MessageSchema, MessageType, MultipartSubtypeEnum
 
-from app.mail.config import mail_config
+from app.core.config import settings
+from app.mail.config import get_mail_config, get_mail_templates
 
-# Initialize FastMail instance
-fm = FastMail(mail_config)
+
+@lru_cache(maxsize=1)
+def get_fast_mail() -> FastMail:
+    """
+    Get the shared FastMail instance, created on first use.
+
+    Returns:
+        FastMail instance configured from settings
+    """
+    return FastMail(get_mail_config())
 
 
 async def send_email(
@@ -46,7 +58,7 @@ async def send_email(
         subtype=subtype,
         attachments=attachments or [],
     )
-    await fm.send_message(message)
+    await get_fast_mail().send_message(message)
     return True
 
 
@@ -95,7 +107,7 @@ async def send_email_background(
         subtype=subtype,
         attachments=attachments or [],
     )
-    background_tasks.add_task(fm.send_message, message)
+    background_tasks.add_task(get_fast_mail().send_message, message)
     return True
 
 
@@ -110,6 +122,9 @@ async def send_email_with_template(
     """
     Send email using Jinja2 template.
 
+    Templates from the mail template folder are rendered from the precompiled
+    cache; unknown templates are left to fastapi-mail to load.
+
     Args:
         recipients: List of recipient email addresses
         subject: Email subject
@@ -133,6 +148,23 @@ async def send_email_with_template(
         )
         ```
     """
+    templates = get_mail_templates()
+
+    if html_template and plain_template:
+        if html_template in templates and plain_template in templates:
+            return await send_multipart_email(
+                recipients=recipients,
+                subject=subject,
+                html_body=templates[html_template].render(**template_body),
+                plain_text_body=templates[plain_template].render(**template_body),
+            )
+    elif template_name in templates:
+        return await send_email(
+            recipients=recipients,
+            subject=subject,
+            body=templates[template_name].render(**template_body),
+        )
+
     message = MessageSchema(
         subject=subject,
         recipients=recipients,
@@ -141,9 +173,11 @@ async def send_email_with_template(
     )
 
     if html_template and plain_template:
-        await fm.send_message(message, html_template=html_template, plain_template=plain_template)
+        await get_fast_mail().send_message(
+            message, html_template=html_template, plain_template=plain_template
+        )
     else:
-        await fm.send_message(message, template_name=template_name)
+        await get_fast_mail().send_message(message, template_name=template_name)
 
     return True
 
@@ -204,7 +238,7 @@ async def send_email_with_attachments(
         subtype=subtype,
         attachments=attachments,
     )
-    await fm.send_message(message)
+    await get_fast_mail().send_message(message)
     return True
 
 
@@ -246,16 +280,17 @@ async def send_multipart_email(
         alternative_body=plain_text_body,
         multipart_subtype=MultipartSubtypeEnum.alternative,
     )
-    await fm.send_message(message)
+    await get_fast_mail().send_message(message)
     return True
 
 
 async def send_bulk_emails(messages: list[MessageSchema]) -> bool:
     """
-    Send multiple emails using a single SMTP connection.
+    Send multiple emails over several SMTP connections in parallel.
 
-    More efficient than sending emails individually as it reuses
-    the SMTP connection for all messages.
+    Messages are spread round-robin over up to MAIL_BULK_CONNECTIONS batches.
+    Each batch reuses one SMTP connection, and the batches are sent
+    concurrently, so per-message round-trips overlap.
 
     Args:
         messages: List of MessageSchema objects to send
@@ -286,7 +321,10 @@ async def send_bulk_emails(messages: list[MessageSchema]) -> bool:
         await send_bulk_emails(messages)
         ```
     """
-    await fm.send_message(messages)
+    connections = min(settings.MAIL_BULK_CONNECTIONS, len(messages))
+    batches = [messages[i::connections] for i in range(connections)]
+    fast_mail = get_fast_mail()
+    await asyncio.gather(*(fast_mail.send_message(batch) for batch in batches))
     return True
 
 
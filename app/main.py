@@ -2,27 +2,22 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, Depends, FastAPI, Request, status
+from cachetools import TTLCache
+from fastapi import APIRouter, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.router import router as auth_router
 from app.core.config import settings
 from app.core.rate_limit import setup_rate_limiting
-from app.db.session import engine, get_db
+from app.core.security import hmac_uses_openssl
+from app.db.migrations import MIGRATION_STATUS, start_migrations, stop_migrations
+from app.db.session import engine, health_engine
+from app.mail.config import warm_up_mail_templates
 from app.mail.router import router as mail_router
 from app.rbac.router import router as rbac_router
-from app.rbac.schemas import (
-    PaginatedPermissionsResponse,
-    PaginatedRolesResponse,
-    PermissionResponse,
-    RoleResponse,
-)
 from app.users.router import router as users_router
-from app.users.schemas import PaginatedUsersResponse, UserResponse
 
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
@@ -42,18 +37,34 @@ async def lifespan(app: FastAPI):
     Args:
         app: FastAPI application instance
     """
+    if not hmac_uses_openssl():
+        logging.warning(
+            "hashlib is not using OpenSSL for SHA-2; JWT signing will use the slow builtin "
+            "implementation. Install Python with OpenSSL-backed hashlib."
+        )
+
+    loop_type = type(asyncio.get_running_loop())
+    logging.info(f"Event loop: {loop_type.__module__}.{loop_type.__qualname__}")
+
     try:
-        async with engine.begin() as conn:
-            await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout=5.0)
+        async with asyncio.timeout(5.0), engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
         logging.info("Database connection verified")
     except asyncio.TimeoutError:
         logging.warning("Database connection timeout during startup - continuing anyway")
     except Exception as e:
         logging.warning(f"Database connection check failed during startup: {e} - continuing anyway")
 
+    app.state.migration_task = await start_migrations(settings.MIGRATION_MODE)
+
+    warm_up_mail_templates()
+
     yield
 
+    await stop_migrations(app.state.migration_task)
+
     await engine.dispose()
+    await health_engine.dispose()
     logging.info("Database connections closed")
 
 
@@ -66,26 +77,17 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+if settings.CORS_ENABLED:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins_list,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["*"],
+    )
 
 setup_rate_limiting(app)
 
-for model in [
-    UserResponse,
-    PaginatedUsersResponse,
-    RoleResponse,
-    PaginatedRolesResponse,
-    PermissionResponse,
-    PaginatedPermissionsResponse,
-]:
-    model.model_rebuild()
-
 # Include feature routers
 app.include_router(auth_router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["auth"])
 app.include_router(users_router, prefix=f"{settings.API_V1_PREFIX}/users", tags=["users"])
@@ -95,27 +97,61 @@ app.include_router(mail_router, prefix=f"{settings.API_V1_PREFIX}/mail", tags=["
 # Health check endpoint
 health_router = APIRouter()
 
+# Last database status, reused for two seconds so frequent liveness probes do not
+# each hit the database. The lock lets one probe refresh it while others wait.
+database_status_cache: TTLCache = TTLCache(maxsize=1, ttl=2.0)
+database_status_lock = asyncio.Lock()
+
+
+async def ping_database() -> None:
+    """
+    Run SELECT 1 on the health check engine.
+    """
+    async with health_engine.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1")
+
+
+async def get_database_status() -> str:
+    """
+    Get the database status, pinging it at most once per cache period.
+
+    Returns:
+        "connected" if the database answered within a second, "disconnected" otherwise
+    """
+    db_status = database_status_cache.get("database")
+    if db_status is not None:
+        return db_status
+
+    async with database_status_lock:
+        db_status = database_status_cache.get("database")
+        if db_status is None:
+            try:
+                async with asyncio.timeout(1.0):
+                    await ping_database()
+                db_status = "connected"
+            except Exception:
+                db_status = "disconnected"
+            database_status_cache["database"] = db_status
+
+    return db_status
+
 
 @health_router.get("/health")
-async def health_check(db: AsyncSession = Depends(get_db)):
+async def health_check():
     """
     Health check endpoint to verify service and database connectivity.
 
-    Args:
-        db: Database session
+    Uses the dedicated health check engine rather than a pooled request session,
+    and reports the database as disconnected if it does not answer within a second.
+    The database status is cached for two seconds.
 
     Returns:
-        Health status with database connection status
+        Health status with database connection and migration status
     """
-    try:
-        await db.execute(text("SELECT 1"))
-        db_status = "connected"
-    except Exception:
-        db_status = "disconnected"
-
     return {
         "status": "healthy",
-        "database": db_status,
+        "database": await get_database_status(),
+        "migrations": MIGRATION_STATUS,
     }
 
 
@@ -145,6 +181,9 @@ async def general_exception_handler(request: Request, exc: Exception):
     """
     General exception handler.
 
+    Only shapes the 500 response. Starlette's ServerErrorMiddleware re-raises the
+    exception after the response is sent, and the server logs it with its traceback.
+
     Args:
         request: FastAPI request object
         exc: Exception
@@ -152,7 +191,6 @@ async def general_exception_handler(request: Request, exc: Exception):
     Returns:
         JSON response with error message
     """
-    logging.error(f"Unhandled exception: {exc}", exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"},
@@ -1,14 +1,20 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.functions import utcnow
+from app.db.search import trigram_index
+
+if TYPE_CHECKING:
+    from app.users.models import User
 
 roles_permissions = Table(
     "roles_permissions",
     Base.metadata,
-    Column("role_id", Integer, ForeignKey("roles.id"), primary_key=True, index=True),
+    Column("role_id", Integer, ForeignKey("roles.id"), primary_key=True),
     Column("permission_id", Integer, ForeignKey("permissions.id"), primary_key=True, index=True),
 )
 
@@ -28,15 +34,24 @@ class Role(Base):
     """
 
     __tablename__ = "roles"
+    __table_args__ = (
+        trigram_index("ix_roles_name_trgm", "name"),
+        trigram_index("ix_roles_description_trgm", "description"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, index=True, nullable=False)
-    description = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    description: Mapped[str | None] = mapped_column(String(255))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
 
-    users = relationship("User", back_populates="role")
-    permissions = relationship("Permission", secondary=roles_permissions, back_populates="roles")
+    users: Mapped[list["User"]] = relationship(back_populates="role")
+    permissions: Mapped[list["Permission"]] = relationship(
+        secondary=roles_permissions, back_populates="roles"
+    )
 
 
 class Permission(Base):
@@ -53,11 +68,20 @@ class Permission(Base):
     """
 
     __tablename__ = "permissions"
+    __table_args__ = (
+        trigram_index("ix_permissions_name_trgm", "name"),
+        trigram_index("ix_permissions_description_trgm", "description"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, index=True, nullable=False)
-    description = Column(String(255), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    description: Mapped[str | None] = mapped_column(String(255))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
 
-    roles = relationship("Role", secondary=roles_permissions, back_populates="permissions")
+    roles: Mapped[list["Role"]] = relationship(
+        secondary=roles_permissions, back_populates="permissions"
+    )
@@ -2,19 +2,15 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
+from app.auth.dependencies import AuthenticatedUser
 from app.core.dependencies import PermissionChecker
 from app.core.rate_limit import get_rate_limit_config, limiter
+from app.core.responses import ORJSONResponse
 from app.db.session import get_db
-from app.rbac.schemas import (
-    PaginatedPermissionsResponse,
-    PaginatedRolesResponse,
-    PermissionResponse,
-    RoleResponse,
-)
+from app.rbac.schemas import PaginatedPermissionsResponse, PaginatedRolesResponse
 from app.rbac.service import get_permissions, get_roles
-from app.users.models import User
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 rate_limit_config = get_rate_limit_config()
 
 
@@ -22,37 +18,42 @@ rate_limit_config = get_rate_limit_config()
 @limiter.limit(rate_limit_config["authenticated"])
 async def list_roles(
     request: Request,
-    skip: int = Query(0, ge=0),
+    after_id: int | None = Query(None, ge=0),
     limit: int = Query(10, ge=1, le=100),
     search: str | None = Query(None),
-    current_user: User = Depends(PermissionChecker("manage_roles")),
+    with_total: bool = Query(False),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("manage_roles")),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List roles with pagination and search.
 
     Args:
-        skip: Number of records to skip
+        after_id: Cursor from the previous page (return items with a greater ID)
         limit: Maximum number of records to return (max 100)
         search: Search in role name and description
+        with_total: Also count all matching records
         current_user: Current authenticated user with manage_roles permission
         db: Database session
 
     Returns:
-        Paginated list of roles
+        Page of roles with the cursor for the next page
     """
     roles, total = await get_roles(
         db=db,
-        skip=skip,
+        after_id=after_id,
         limit=limit,
         search=search,
+        with_total=with_total,
     )
 
-    return PaginatedRolesResponse(
-        items=[RoleResponse.model_validate(role) for role in roles],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return ORJSONResponse(
+        {
+            "items": roles,
+            "total": total,
+            "limit": limit,
+            "next_cursor": roles[-1]["id"] if len(roles) == limit else None,
+        }
     )
 
 
@@ -60,35 +61,40 @@ async def list_roles(
 @limiter.limit(rate_limit_config["authenticated"])
 async def list_permissions(
     request: Request,
-    skip: int = Query(0, ge=0),
+    after_id: int | None = Query(None, ge=0),
     limit: int = Query(10, ge=1, le=100),
     search: str | None = Query(None),
-    current_user: User = Depends(PermissionChecker("manage_roles")),
+    with_total: bool = Query(False),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("manage_roles")),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List permissions with pagination and search.
 
     Args:
-        skip: Number of records to skip
+        after_id: Cursor from the previous page (return items with a greater ID)
         limit: Maximum number of records to return (max 100)
         search: Search in permission name and description
+        with_total: Also count all matching records
         current_user: Current authenticated user with manage_roles permission
         db: Database session
 
     Returns:
-        Paginated list of permissions
+        Page of permissions with the cursor for the next page
     """
     permissions, total = await get_permissions(
         db=db,
-        skip=skip,
+        after_id=after_id,
         limit=limit,
         search=search,
+        with_total=with_total,
     )
 
-    return PaginatedPermissionsResponse(
-        items=[PermissionResponse.model_validate(perm) for perm in permissions],
-        total=total,
-        skip=skip,
-        limit=limit,
+    return ORJSONResponse(
+        {
+            "items": permissions,
+            "total": total,
+            "limit": limit,
+            "next_cursor": permissions[-1]["id"] if len(permissions) == limit else None,
+        }
     )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PermissionResponse(BaseModel):
@@ -15,15 +15,14 @@ class PermissionResponse(BaseModel):
         updated_at: Last update timestamp
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     description: str | None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class RoleResponse(BaseModel):
     """
@@ -38,6 +37,8 @@ class RoleResponse(BaseModel):
         updated_at: Last update timestamp
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     description: str | None
@@ -45,39 +46,36 @@ class RoleResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class PaginatedRolesResponse(BaseModel):
     """
-    Paginated response for role list.
+    Keyset-paginated response for role list.
 
     Attributes:
         items: List of roles
-        total: Total number of roles
-        skip: Number of roles skipped
+        total: Total number of roles (only when requested with with_total)
         limit: Maximum number of roles per page
+        next_cursor: Value for after_id to fetch the next page, None on the last page
     """
 
     items: list[RoleResponse]
-    total: int
-    skip: int
+    total: int | None = None
     limit: int
+    next_cursor: int | None = None
 
 
 class PaginatedPermissionsResponse(BaseModel):
     """
-    Paginated response for permission list.
+    Keyset-paginated response for permission list.
 
     Attributes:
         items: List of permissions
-        total: Total number of permissions
-        skip: Number of permissions skipped
+        total: Total number of permissions (only when requested with with_total)
         limit: Maximum number of permissions per page
+        next_cursor: Value for after_id to fetch the next page, None on the last page
     """
 
     items: list[PermissionResponse]
-    total: int
-    skip: int
+    total: int | None = None
     limit: int
+    next_cursor: int | None = None
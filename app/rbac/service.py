@@ -1,8 +1,21 @@
-from sqlalchemy import func, or_, select
+import asyncio
+
+from sqlalchemy import func, lambda_stmt, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.rbac.models import Permission, Role
+from app.db.search import LIKE_ESCAPE_CHAR, contains_pattern
+from app.db.session import scalar_in_new_session
+from app.rbac.models import Permission, Role, roles_permissions
+
+ROLE_COLUMNS = (Role.id, Role.name, Role.description, Role.created_at, Role.updated_at)
+PERMISSION_COLUMNS = (
+    Permission.id,
+    Permission.name,
+    Permission.description,
+    Permission.created_at,
+    Permission.updated_at,
+)
 
 
 async def get_role_by_id(db: AsyncSession, role_id: int) -> Role | None:
@@ -16,7 +29,9 @@ async def get_role_by_id(db: AsyncSession, role_id: int) -> Role | None:
     Returns:
         Role object with permissions, or None if not found
     """
-    stmt = select(Role).options(selectinload(Role.permissions)).filter(Role.id == role_id)
+    stmt = lambda_stmt(
+        lambda: select(Role).options(selectinload(Role.permissions)).filter(Role.id == role_id)
+    )
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
@@ -32,48 +47,73 @@ async def get_role_by_name(db: AsyncSession, name: str) -> Role | None:
     Returns:
         Role object with permissions, or None if not found
     """
-    stmt = select(Role).options(selectinload(Role.permissions)).filter(Role.name == name)
+    stmt = lambda_stmt(
+        lambda: select(Role).options(selectinload(Role.permissions)).filter(Role.name == name)
+    )
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
 async def get_roles(
     db: AsyncSession,
-    skip: int = 0,
+    after_id: int | None = None,
     limit: int = 10,
     search: str | None = None,
-) -> tuple[list[Role], int]:
+    with_total: bool = False,
+) -> tuple[list[dict], int | None]:
     """
-    Get paginated list of roles with search.
+    Get a page of roles with search, using keyset pagination on ID.
+
+    Selects plain columns instead of ORM objects so rows can be serialized
+    directly. Permissions for the page are loaded with a single extra query.
+    The optional count runs concurrently on a separate session.
 
     Args:
         db: Database session
-        skip: Number of records to skip
+        after_id: Only return roles with an ID greater than this cursor
         limit: Maximum number of records to return
         search: Search in role name and description
+        with_total: Whether to count all matching roles
 
     Returns:
-        Tuple of (list of roles, total count)
+        Tuple of (list of role dicts with permissions, total count or None)
     """
-    stmt = select(Role).options(selectinload(Role.permissions))
-
+    filters = []
     if search:
-        stmt = stmt.filter(
+        pattern = contains_pattern(search)
+        filters.append(
             or_(
-                Role.name.ilike(f"%{search}%"),
-                Role.description.ilike(f"%{search}%"),
+                Role.name.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
+                Role.description.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
             )
         )
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar()
-
-    stmt = stmt.order_by(Role.id.asc()).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    roles = result.scalars().all()
+    count_stmt = select(func.count()).select_from(Role).filter(*filters)
+
+    if after_id is not None:
+        filters.append(Role.id > after_id)
+
+    stmt = select(*ROLE_COLUMNS).filter(*filters).order_by(Role.id.asc()).limit(limit)
+    if with_total:
+        total, result = await asyncio.gather(scalar_in_new_session(count_stmt), db.execute(stmt))
+    else:
+        total, result = None, await db.execute(stmt)
+    roles = [{**row, "permissions": []} for row in result.mappings()]
+
+    if roles:
+        roles_by_id = {role["id"]: role for role in roles}
+        permissions_stmt = (
+            select(roles_permissions.c.role_id, *PERMISSION_COLUMNS)
+            .join(roles_permissions, roles_permissions.c.permission_id == Permission.id)
+            .filter(roles_permissions.c.role_id.in_(roles_by_id))
+            .order_by(Permission.id.asc())
+        )
+        permissions_result = await db.execute(permissions_stmt)
+        for row in permissions_result.mappings():
+            permission = dict(row)
+            roles_by_id[permission.pop("role_id")]["permissions"].append(permission)
 
-    return list(roles), total
+    return roles, total
 
 
 async def get_permission_by_id(db: AsyncSession, permission_id: int) -> Permission | None:
@@ -87,7 +127,7 @@ async def get_permission_by_id(db: AsyncSession, permission_id: int) -> Permissi
     Returns:
         Permission object, or None if not found
     """
-    stmt = select(Permission).filter(Permission.id == permission_id)
+    stmt = lambda_stmt(lambda: select(Permission).filter(Permission.id == permission_id))
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
@@ -103,45 +143,54 @@ async def get_permission_by_name(db: AsyncSession, name: str) -> Permission | No
     Returns:
         Permission object, or None if not found
     """
-    stmt = select(Permission).filter(Permission.name == name)
+    stmt = lambda_stmt(lambda: select(Permission).filter(Permission.name == name))
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
 async def get_permissions(
     db: AsyncSession,
-    skip: int = 0,
+    after_id: int | None = None,
     limit: int = 10,
     search: str | None = None,
-) -> tuple[list[Permission], int]:
+    with_total: bool = False,
+) -> tuple[list[dict], int | None]:
     """
-    Get paginated list of permissions with search.
+    Get a page of permissions with search, using keyset pagination on ID.
+
+    Selects plain columns instead of ORM objects so rows can be serialized
+    directly. The optional count runs concurrently on a separate session.
 
     Args:
         db: Database session
-        skip: Number of records to skip
+        after_id: Only return permissions with an ID greater than this cursor
         limit: Maximum number of records to return
         search: Search in permission name and description
+        with_total: Whether to count all matching permissions
 
     Returns:
-        Tuple of (list of permissions, total count)
+        Tuple of (list of permission dicts, total count or None)
     """
-    stmt = select(Permission)
-
+    filters = []
     if search:
-        stmt = stmt.filter(
+        pattern = contains_pattern(search)
+        filters.append(
             or_(
-                Permission.name.ilike(f"%{search}%"),
-                Permission.description.ilike(f"%{search}%"),
+                Permission.name.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
+                Permission.description.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
             )
         )
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar()
+    count_stmt = select(func.count()).select_from(Permission).filter(*filters)
 
-    stmt = stmt.order_by(Permission.id.asc()).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    permissions = result.scalars().all()
+    if after_id is not None:
+        filters.append(Permission.id > after_id)
+
+    stmt = select(*PERMISSION_COLUMNS).filter(*filters).order_by(Permission.id.asc()).limit(limit)
+    if with_total:
+        total, result = await asyncio.gather(scalar_in_new_session(count_stmt), db.execute(stmt))
+    else:
+        total, result = None, await db.execute(stmt)
+    permissions = [dict(row) for row in result.mappings()]
 
-    return list(permissions), total
+    return permissions, total
@@ -1,9 +1,15 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.functions import utcnow
+from app.db.search import trigram_index
+
+if TYPE_CHECKING:
+    from app.rbac.models import Role
 
 
 class User(Base):
@@ -14,7 +20,7 @@ class User(Base):
         id: Primary key
         email: User email address (unique, indexed)
         username: Username (unique, indexed)
-        hashed_password: Bcrypt hashed password
+        hashed_password: Argon2id hashed password
         role_id: Foreign key to roles table (indexed)
         created_at: Timestamp when user was created
         updated_at: Timestamp when user was last updated
@@ -22,13 +28,23 @@ class User(Base):
     """
 
     __tablename__ = "users"
-
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String(255), unique=True, index=True, nullable=False)
-    username = Column(String(50), unique=True, index=True, nullable=False)
-    hashed_password = Column(String(255), nullable=False)
-    role_id = Column(Integer, ForeignKey("roles.id"), index=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-
-    role = relationship("Role", back_populates="users")
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        trigram_index("ix_users_email_trgm", "email"),
+        trigram_index("ix_users_username_trgm", "username"),
+    )
+    # Fetch the database-generated timestamps with RETURNING after INSERT and UPDATE,
+    # so they are never lazy-loaded
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(255))
+    role_id: Mapped[int] = mapped_column(ForeignKey("roles.id"), index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=utcnow(), onupdate=utcnow()
+    )
+
+    role: Mapped["Role"] = relationship(back_populates="users")
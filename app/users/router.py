@@ -2,8 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import (
+    AuthenticatedUser,
+    get_current_user,
+    invalidate_current_user_cache,
+)
 from app.core.dependencies import PermissionChecker
+from app.core.query_params import SortOrder
 from app.core.rate_limit import get_rate_limit_config, limiter
 from app.db.session import get_db
 from app.users.models import User
@@ -35,7 +40,7 @@ async def get_me(
 async def get_user(
     request: Request,
     user_id: int,
-    current_user: User = Depends(PermissionChecker("read_user")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("read_user")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -72,45 +77,60 @@ async def list_users(
     role_id: int | None = Query(None),
     search: str | None = Query(None),
     sort_by: str = Query("id"),
-    order: str = Query("asc"),
-    current_user: User = Depends(PermissionChecker("read_user")),
+    order: SortOrder = Query(SortOrder.ASC),
+    after_id: int | None = Query(None, ge=0),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("read_user")),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List users with pagination, filtering, searching, and sorting.
 
     Args:
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when after_id is given)
         limit: Maximum number of records to return (max 100)
         email: Filter by email
         username: Filter by username
         role_id: Filter by role ID
         search: Search in email and username
-        sort_by: Field to sort by
+        sort_by: Field to sort by (id, email, username or created_at)
         order: Sort order (asc/desc)
+        after_id: Cursor from the previous page (next_cursor)
         current_user: Current authenticated user with read_user permission
         db: Database session
 
     Returns:
         Paginated list of users
+
+    Raises:
+        HTTPException: 400 if after_id points to a deleted user when sorting by a
+            column other than id
     """
-    users, total = await get_users(
-        db=db,
-        skip=skip,
-        limit=limit,
-        email=email,
-        username=username,
-        role_id=role_id,
-        search=search,
-        sort_by=sort_by,
-        order=order,
-    )
+    try:
+        users, total, total_estimated = await get_users(
+            db=db,
+            skip=skip,
+            limit=limit,
+            email=email,
+            username=username,
+            role_id=role_id,
+            search=search,
+            sort_by=sort_by,
+            order=order,
+            after_id=after_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor: the user it points to no longer exists",
+        ) from e
 
     return PaginatedUsersResponse(
         items=[UserResponse.model_validate(user) for user in users],
         total=total,
-        skip=skip,
+        total_estimated=total_estimated,
+        skip=skip if after_id is None else 0,
         limit=limit,
+        next_cursor=users[-1].id if len(users) == limit else None,
     )
 
 
@@ -120,7 +140,7 @@ async def update_user_endpoint(
     request: Request,
     user_id: int,
     user_data: UserUpdate,
-    current_user: User = Depends(PermissionChecker("update_user")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("update_user")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -139,6 +159,7 @@ async def update_user_endpoint(
         HTTPException: 404 if user not found
     """
     user = await update_user(db, user_id, user_data)
+    invalidate_current_user_cache(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -152,7 +173,7 @@ async def update_user_endpoint(
 async def delete_user_endpoint(
     request: Request,
     user_id: int,
-    current_user: User = Depends(PermissionChecker("delete_user")),
+    current_user: AuthenticatedUser = Depends(PermissionChecker("delete_user")),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -167,6 +188,7 @@ async def delete_user_endpoint(
         HTTPException: 404 if user not found
     """
     deleted = await delete_user(db, user_id)
+    invalidate_current_user_cache(user_id)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, SecretStr
 
 from app.rbac.schemas import RoleResponse
 
@@ -26,7 +26,7 @@ class UserCreate(UserBase):
         password: Plain text password (will be hashed)
     """
 
-    password: str = Field(..., min_length=8)
+    password: SecretStr = Field(..., min_length=8)
 
 
 class UserUpdate(BaseModel):
@@ -58,15 +58,14 @@ class UserResponse(UserBase):
         updated_at: Last update timestamp
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     role_id: int
     role: RoleResponse | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class PaginatedUsersResponse(BaseModel):
     """
@@ -75,11 +74,16 @@ class PaginatedUsersResponse(BaseModel):
     Attributes:
         items: List of users
         total: Total number of users
+        total_estimated: Whether total is PostgreSQL's row estimate rather than
+            an exact count (only for unfiltered lists of large tables)
         skip: Number of users skipped
         limit: Maximum number of users per page
+        next_cursor: Value for after_id to fetch the next page, None on the last page
     """
 
     items: list[UserResponse]
     total: int
+    total_estimated: bool = False
     skip: int
     limit: int
+    next_cursor: int | None = None
@@ -1,17 +1,46 @@
-from sqlalchemy import func, or_, select
+import asyncio
+
+from cachetools import TTLCache
+from sqlalchemy import delete, exists, func, lambda_stmt, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
-from app.core.security import get_password_hash
+from app.core.query_params import SortOrder
+from app.core.security import get_password_hash, run_password_kdf
+from app.db.search import LIKE_ESCAPE_CHAR, contains_pattern
+from app.db.session import scalar_in_new_session
 from app.rbac.models import Role
 from app.users.models import User
 from app.users.schemas import UserUpdate
 
+# Columns the user list may be sorted by, each backed by an index. Other values
+# fall back to ID instead of sorting the whole filtered set.
+USER_SORT_COLUMNS = {
+    "id": User.id,
+    "email": User.email,
+    "username": User.username,
+    "created_at": User.created_at,
+}
+
+# User lists join each user's role into the page query (many-to-one, so rows are
+# not multiplied) and load the permissions of the page's roles in one extra query
+USER_LIST_LOADER = joinedload(User.role).selectinload(Role.permissions)
+
+# Unfiltered user lists report PostgreSQL's row estimate instead of an exact
+# count once the table is this large, since COUNT(*) has to scan every row
+USER_COUNT_ESTIMATE_THRESHOLD = 100_000
+
+# table name -> planner row estimate (-1 when unknown)
+user_count_estimate_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
     """
     Get user by ID with role and permissions loaded.
 
+    Single-user lookups join the role and its permissions into one query
+    instead of issuing separate selectin queries.
+
     Args:
         db: Database session
         user_id: User ID
@@ -19,13 +48,13 @@ async def get_user_by_id(db: AsyncSession, user_id: int) -> User | None:
     Returns:
         User object with role and permissions, or None if not found
     """
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
+    stmt = lambda_stmt(
+        lambda: select(User)
+        .options(joinedload(User.role).joinedload(Role.permissions))
         .filter(User.id == user_id)
     )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    return result.unique().scalar_one_or_none()
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
@@ -39,13 +68,30 @@ async def get_user_by_email(db: AsyncSession, email: str) -> User | None:
     Returns:
         User object with role and permissions, or None if not found
     """
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
+    stmt = lambda_stmt(
+        lambda: select(User)
+        .options(joinedload(User.role).joinedload(Role.permissions))
         .filter(User.email == email)
     )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    return result.unique().scalar_one_or_none()
+
+
+async def email_exists(db: AsyncSession, email: str) -> bool:
+    """
+    Check whether a user with the given email exists.
+
+    Answered from the unique email index without loading the user.
+
+    Args:
+        db: Database session
+        email: User email
+
+    Returns:
+        True if a user with this email exists, False otherwise
+    """
+    result = await db.execute(lambda_stmt(lambda: select(exists().where(User.email == email))))
+    return bool(result.scalar())
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
@@ -59,13 +105,56 @@ async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
     Returns:
         User object with role and permissions, or None if not found
     """
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
+    stmt = lambda_stmt(
+        lambda: select(User)
+        .options(joinedload(User.role).joinedload(Role.permissions))
         .filter(User.username == username)
     )
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    return result.unique().scalar_one_or_none()
+
+
+async def get_user_by_username_or_email(db: AsyncSession, identifier: str) -> User | None:
+    """
+    Get user by username or email with role and permissions loaded.
+
+    Identifiers containing "@" are looked up by email first, so one user's
+    username can never shadow another user's email. If no email matches, they
+    fall back to the username lookup: usernames created before registration
+    restricted their characters may contain "@". Other identifiers are looked
+    up by username only.
+
+    Args:
+        db: Database session
+        identifier: Username or email
+
+    Returns:
+        User object with role and permissions, or None if not found
+    """
+    if "@" in identifier:
+        user = await get_user_by_email(db, identifier)
+        if user is not None:
+            return user
+    return await get_user_by_username(db, identifier)
+
+
+async def get_users_by_email_or_username(db: AsyncSession, email: str, username: str) -> list[User]:
+    """
+    Get users matching either an email or a username in a single query.
+
+    Used for uniqueness checks, so relationships are not loaded.
+
+    Args:
+        db: Database session
+        email: User email
+        username: Username
+
+    Returns:
+        List of up to two users matching the email or the username
+    """
+    stmt = select(User).filter(or_(User.email == email, User.username == username)).limit(2)
+    result = await db.execute(stmt)
+    return result.scalars().all()
 
 
 async def update_user(db: AsyncSession, user_id: int, user_data: UserUpdate) -> User | None:
@@ -86,27 +175,28 @@ async def update_user(db: AsyncSession, user_id: int, user_data: UserUpdate) ->
 
     update_data = user_data.model_dump(exclude_unset=True)
     if "password" in update_data:
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+        update_data["hashed_password"] = await run_password_kdf(
+            get_password_hash, update_data.pop("password")
+        )
 
     for field, value in update_data.items():
         setattr(user, field, value)
 
     await db.commit()
-    await db.refresh(user)
 
-    stmt = (
-        select(User)
-        .options(selectinload(User.role).selectinload(Role.permissions))
-        .filter(User.id == user_id)
-    )
-    result = await db.execute(stmt)
-    return result.scalar_one()
+    # Only a role change leaves loaded relationships stale; reload in that case.
+    if "role_id" in update_data:
+        db.expire(user)
+        return await get_user_by_id(db, user_id)
+    return user
 
 
 async def delete_user(db: AsyncSession, user_id: int) -> bool:
     """
     Delete a user.
 
+    Uses a single DELETE ... RETURNING instead of loading the user first.
+
     Args:
         db: Database session
         user_id: User ID to delete
@@ -114,13 +204,38 @@ async def delete_user(db: AsyncSession, user_id: int) -> bool:
     Returns:
         True if user was deleted, False if not found
     """
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-
-    await db.delete(user)
+    stmt = delete(User).where(User.id == user_id).returning(User.id)
+    deleted_id = (await db.execute(stmt)).scalar_one_or_none()
     await db.commit()
-    return True
+    return deleted_id is not None
+
+
+async def estimate_user_count(db: AsyncSession) -> int | None:
+    """
+    Get PostgreSQL's row estimate for the users table.
+
+    Reads reltuples from pg_class, which VACUUM and ANALYZE keep up to date,
+    so it costs a catalog lookup instead of a table scan. Cached for a minute.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Estimated number of users, or None if not on PostgreSQL or the table
+        has not been analyzed yet
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+
+    estimate = user_count_estimate_cache.get(User.__tablename__)
+    if estimate is None:
+        stmt = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+        estimate = await db.scalar(stmt, {"table": User.__tablename__})
+        if estimate is None:
+            estimate = -1
+        user_count_estimate_cache[User.__tablename__] = estimate
+
+    return estimate if estimate >= 0 else None
 
 
 async def get_users(
@@ -132,55 +247,120 @@ async def get_users(
     role_id: int | None = None,
     search: str | None = None,
     sort_by: str = "id",
-    order: str = "asc",
-) -> tuple[list[User], int]:
+    order: SortOrder = SortOrder.ASC,
+    after_id: int | None = None,
+) -> tuple[list[User], int, bool]:
     """
     Get paginated list of users with filtering, searching, and sorting.
 
-    Uses eager loading to prevent N+1 problems.
+    Uses eager loading to prevent N+1 problems (see USER_LIST_LOADER). Pages are
+    addressed either by offset (skip) or by keyset: with after_id, only users
+    sorting after that user are returned, which stays fast on deep pages. Offset
+    pages compute the total with a COUNT(*) OVER () window column in the same
+    query; keyset pages count concurrently on a separate session, since the keyset
+    filter would narrow the window count. Without filters, tables of at least
+    USER_COUNT_ESTIMATE_THRESHOLD rows report the planner's row estimate
+    instead of counting.
 
     Args:
         db: Database session
-        skip: Number of records to skip
+        skip: Number of records to skip (ignored when after_id is given)
         limit: Maximum number of records to return
         email: Filter by email
         username: Filter by username
         role_id: Filter by role ID
         search: Search in email and username
-        sort_by: Field to sort by
+        sort_by: Field to sort by (one of USER_SORT_COLUMNS, otherwise ID)
         order: Sort order (asc/desc)
+        after_id: ID of the last user of the previous page
 
     Returns:
-        Tuple of (list of users, total count)
-    """
-    stmt = select(User).options(selectinload(User.role).selectinload(Role.permissions))
+        Tuple of (list of users, total count, whether the total is an estimate)
 
+    Raises:
+        ValueError: If after_id is given with a sort column other than ID and the
+            cursor user no longer exists
+    """
+    filters = []
     if email:
-        stmt = stmt.filter(User.email == email)
+        filters.append(User.email == email)
     if username:
-        stmt = stmt.filter(User.username == username)
+        filters.append(User.username == username)
     if role_id:
-        stmt = stmt.filter(User.role_id == role_id)
+        filters.append(User.role_id == role_id)
     if search:
-        stmt = stmt.filter(
+        pattern = contains_pattern(search)
+        filters.append(
             or_(
-                User.email.ilike(f"%{search}%"),
-                User.username.ilike(f"%{search}%"),
+                User.email.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
+                User.username.ilike(pattern, escape=LIKE_ESCAPE_CHAR),
             )
         )
 
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar()
-
-    sort_column = getattr(User, sort_by, User.id)
-    if order.lower() == "desc":
-        stmt = stmt.order_by(sort_column.desc())
+    sort_column = USER_SORT_COLUMNS.get(sort_by, User.id)
+    descending = order is SortOrder.DESC
+    if descending:
+        stmt_order = (sort_column.desc(), User.id.desc())
     else:
-        stmt = stmt.order_by(sort_column.asc())
+        stmt_order = (sort_column.asc(), User.id.asc())
+
+    estimated_total = None
+    if not filters:
+        estimate = await estimate_user_count(db)
+        if estimate is not None and estimate >= USER_COUNT_ESTIMATE_THRESHOLD:
+            estimated_total = estimate
+
+    if after_id is not None:
+        count_stmt = select(func.count()).select_from(User).filter(*filters)
+        if sort_column is User.id:
+            keyset, cursor = User.id, after_id
+        else:
+            # Compare (sort value, id) with the cursor user's, so ties on the sort
+            # column continue by ID without skipping or repeating rows. The cursor
+            # only carries the ID, so a deleted cursor user cannot be positioned.
+            cursor_value = await db.scalar(select(sort_column).filter(User.id == after_id))
+            if cursor_value is None:
+                raise ValueError("Cursor user not found")
+            keyset = tuple_(sort_column, User.id)
+            cursor = tuple_(cursor_value, after_id)
+        stmt = (
+            select(User)
+            .options(USER_LIST_LOADER)
+            .filter(*filters, keyset < cursor if descending else keyset > cursor)
+            .order_by(*stmt_order)
+            .limit(limit)
+        )
+        if estimated_total is not None:
+            result = await db.execute(stmt)
+            return result.scalars().all(), estimated_total, True
+        total, result = await asyncio.gather(scalar_in_new_session(count_stmt), db.execute(stmt))
+        return result.scalars().all(), total, False
+
+    if estimated_total is not None:
+        stmt = (
+            select(User).options(USER_LIST_LOADER).order_by(*stmt_order).offset(skip).limit(limit)
+        )
+        result = await db.execute(stmt)
+        return result.scalars().all(), estimated_total, True
 
-    stmt = stmt.offset(skip).limit(limit)
+    stmt = (
+        select(User, func.count().over().label("total"))
+        .options(USER_LIST_LOADER)
+        .filter(*filters)
+        .order_by(*stmt_order)
+        .offset(skip)
+        .limit(limit)
+    )
     result = await db.execute(stmt)
-    users = result.scalars().all()
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Past the last page the window count has no row to ride on
+        count_stmt = select(func.count()).select_from(User).filter(*filters)
+        total = await db.scalar(count_stmt)
+    else:
+        total = 0
 
-    return list(users), total
+    return [row.User for row in rows], total, False